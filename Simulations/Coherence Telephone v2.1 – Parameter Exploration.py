@@ -4,15 +4,32 @@ Test experimental knobs: drive strength, Chern number, integration time.
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
 import matplotlib.pyplot as plt
 
+
+def receiver_response(t, y0, gamma_B, omega_B, total_coupling):
+    """
+    Exact solution of the receiver model for y = [EB_applied, Φ_B]:
+
+        dEB/dt = 0                      (sender: we control EB_applied directly)
+        dΦ_B/dt = -γ_B Φ_B + g·EB - ω_B² Φ_B   (damped receiver driven by the field)
+
+    EB_applied stays at its initial value, so Φ_B relaxes exponentially to
+    g·EB/(γ_B + ω_B²). Evaluated in closed form on the whole time grid
+    instead of integrating the ODE numerically.
+    """
+    EB0, Phi0 = y0
+    rate = gamma_B + omega_B**2
+    Phi_eq = total_coupling * EB0 / rate
+    return Phi_eq + (Phi0 - Phi_eq) * np.exp(-rate * t)
+
 def run_coherence_simulation(Chern_sender=3.0,
                              Chern_receiver=3.0,
                              drive_amplitude=1.0,    # E·B drive strength (V·T/m)
                              bit_duration=2.0,       # seconds per bit
                              qubit_coherence_time=5.0,  # T2* in seconds (1/gamma_B)
-                             message_bits=None):
+                             message_bits=None,
+                             samples_per_bit=10):
     
     if message_bits is None:
         message_bits = [1, 0, 1, 1, 0, 1, 0, 0, 1, 1]
@@ -43,56 +60,44 @@ def run_coherence_simulation(Chern_sender=3.0,
     omega_B = theta_receiver  # Resonance frequency
     
     # ====================== DYNAMICS ======================
-    def sender_modulation(t):
-        """E·B drive signal."""
-        bit_index = int(t / bit_duration) % len(message_bits)
-        return drive_amplitude if message_bits[bit_index] else -drive_amplitude
-    
-    def system_dynamics(t, y):
-        EB_applied, Phi_B = y
-        # Sender: we control EB_applied directly
-        dEB_dt = 0
-        
-        # Receiver: damped oscillator driven by coherence field
-        field_drive = total_coupling * EB_applied
-        dPhiB_dt = -gamma_B * Phi_B + field_drive - omega_B**2 * Phi_B
-        
-        return [dEB_dt, dPhiB_dt]
+    # Bits as a compact 0/1 int8 array (any truthy entry counts as a 1)
+    msg_arr = (np.asarray(message_bits) != 0).astype(np.int8)
     
     # ====================== SIMULATION ======================
-    t_end = len(message_bits) * bit_duration
-    t_eval = np.linspace(0, t_end, int(t_end * 100))  # 100 Hz sampling
-    
-    sol = solve_ivp(system_dynamics, [0, t_end], [0.0, 0.0], 
-                    t_eval=t_eval, method='RK45', rtol=1e-6)
-    
-    t = sol.t
-    EB_applied_hist = sender_modulation(t)
-    Phi_B_hist = sol.y[1]
+    # The receiver is evaluated in closed form and decoded per bit, so the
+    # grid only needs to resolve each bit window: samples_per_bit samples
+    # per bit, aligned so that bit i covers samples [i*spb, (i+1)*spb)
+    n_bits = len(message_bits)
+    t_end = n_bits * bit_duration
+    t_eval = np.linspace(0, t_end, n_bits * samples_per_bit, endpoint=False)
+    
+    t = t_eval
+    # E·B drive signal: ±drive_amplitude for the bit each sample belongs to.
+    # Gathered by sample index, since recovering the bit from t / bit_duration
+    # can round the first sample of a bit into the previous one
+    EB_applied_hist = drive_amplitude * (2.0 * np.repeat(msg_arr, samples_per_bit) - 1.0)
+    Phi_B_hist = receiver_response(t, [0.0, 0.0], gamma_B, omega_B, total_coupling)
     
     # ====================== DETECTION & DECODING ======================
-    decoded_bits = []
-    detection_times = []
-    
-    for i, bit in enumerate(message_bits):
-        start_idx = int(i * bit_duration * 100)
-        end_idx = int((i + 1) * bit_duration * 100)
-        segment = Phi_B_hist[start_idx:end_idx]
-        
-        # Average value for decoding
-        avg_val = np.mean(segment)
-        decoded_bit = 1 if avg_val > 0 else 0
-        decoded_bits.append(decoded_bit)
-        
-        # Time to cross detection threshold (0.2 * drive_amplitude)
-        threshold = 0.2 * drive_amplitude * np.sign(bit if bit else -1)
-        if np.any(np.abs(segment) > np.abs(threshold)):
-            cross_idx = np.where(np.abs(segment) > np.abs(threshold))[0]
-            if len(cross_idx) > 0:
-                detection_times.append(t[start_idx + cross_idx[0]])
+    # One row per bit window
+    Phi_bits = Phi_B_hist.reshape(n_bits, samples_per_bit)
+    
+    # Average value per bit for decoding
+    avg_vals = Phi_bits.mean(axis=1)
+    decoded_arr = (avg_vals > 0).astype(np.int8)
+    decoded_bits = decoded_arr.astype(int).tolist()
+    
+    # Time to first cross the detection threshold within each bit window. The
+    # signed threshold ±0.2 * drive_amplitude has the same magnitude for both
+    # bit values, so only its absolute value is needed
+    thr_abs = abs(0.2 * drive_amplitude)
+    above = np.abs(Phi_bits) > thr_abs
+    hit = above.any(axis=1)
+    first = np.flatnonzero(hit) * samples_per_bit + above[hit].argmax(axis=1)
+    detection_times = t[first].tolist()
     
     # ====================== RESULTS ======================
-    ber = np.mean([a != b for a, b in zip(message_bits, decoded_bits)])
+    ber = np.mean(msg_arr != decoded_arr)
     avg_detection_time = np.mean(detection_times) if detection_times else t_end
     
     results = {
@@ -112,42 +117,44 @@ def run_coherence_simulation(Chern_sender=3.0,
 print("Coherence Telephone v2.1 – Parameter Exploration")
 print("="*60)
 
+# The five runs share no state; they are evaluated up front and reported in
+# order below
+sweep_configs = [
+    dict(Chern_sender=3.0, Chern_receiver=3.0, drive_amplitude=1.0, qubit_coherence_time=5.0),
+    dict(Chern_sender=3.0, Chern_receiver=3.0, drive_amplitude=10.0, qubit_coherence_time=5.0),
+    dict(Chern_sender=3.0, Chern_receiver=3.0, drive_amplitude=1.0, qubit_coherence_time=50.0),
+    dict(Chern_sender=5.0, Chern_receiver=5.0, drive_amplitude=1.0, qubit_coherence_time=5.0),
+    dict(Chern_sender=3.0, Chern_receiver=2.0, drive_amplitude=10.0, qubit_coherence_time=50.0),
+]
+results1, results2, results3, results4, results5 = [
+    run_coherence_simulation(**cfg) for cfg in sweep_configs]
+
 # Test 1: Baseline (your original result)
 print("\n1. BASELINE (Matched C=3, Low Drive)")
-results1 = run_coherence_simulation(Chern_sender=3.0, Chern_receiver=3.0,
-                                    drive_amplitude=1.0, qubit_coherence_time=5.0)
 print(f"   Coupling: {results1['total_coupling']:.6f}")
 print(f"   BER: {results1['ber']:.1%}")
 print(f"   Avg detection: {results1['detection_time']:.2f}s")
 
 # Test 2: Boosted Drive (Experimental knob)
 print("\n2. BOOSTED DRIVE (10x Amplitude)")
-results2 = run_coherence_simulation(Chern_sender=3.0, Chern_receiver=3.0,
-                                    drive_amplitude=10.0, qubit_coherence_time=5.0)
 print(f"   Coupling: {results2['total_coupling']:.6f}")
 print(f"   BER: {results2['ber']:.1%}")
 print(f"   Avg detection: {results2['detection_time']:.2f}s")
 
 # Test 3: Better Qubit (Longer T2*)
 print("\n3. BETTER QUBIT (T2* = 50s)")
-results3 = run_coherence_simulation(Chern_sender=3.0, Chern_receiver=3.0,
-                                    drive_amplitude=1.0, qubit_coherence_time=50.0)
 print(f"   Coupling: {results3['total_coupling']:.6f}")
 print(f"   BER: {results3['ber']:.1%}")
 print(f"   Avg detection: {results3['detection_time']:.2f}s")
 
 # Test 4: Higher Chern Number
 print("\n4. HIGHER CHERN (C=5)")
-results4 = run_coherence_simulation(Chern_sender=5.0, Chern_receiver=5.0,
-                                    drive_amplitude=1.0, qubit_coherence_time=5.0)
 print(f"   Coupling: {results4['total_coupling']:.6f}")
 print(f"   BER: {results4['ber']:.1%}")
 print(f"   Avg detection: {results4['detection_time']:.2f}s")
 
 # Test 5: Mismatched (Control)
 print("\n5. CONTROL (Mismatched C=3 vs C=2)")
-results5 = run_coherence_simulation(Chern_sender=3.0, Chern_receiver=2.0,
-                                    drive_amplitude=10.0, qubit_coherence_time=50.0)
 print(f"   Coupling: {results5['total_coupling']:.6f}")
 print(f"   BER: {results5['ber']:.1%}")
 
@@ -157,8 +164,11 @@ all_results = [results1, results2, results3, results4, results5]
 titles = ['Baseline', '10x Drive', 'Better Qubit', 'C=5', 'Mismatched C=3 vs C=2']
 
 for idx, (ax, results, title) in enumerate(zip(axes.flatten()[:5], all_results[:5], titles)):
-    ax.plot(results['t'], results['EB_applied'], 'cyan', alpha=0.7, label='E·B Drive')
-    ax.plot(results['t'], results['Phi_B'], 'white', lw=1.5, label='Receiver Φ_B')
+    # Long time series are rasterized so vector exports (PDF/SVG) embed one
+    # image per trace instead of thousands of path segments
+    ax.plot(results['t'], results['EB_applied'], 'cyan', alpha=0.7, label='E·B Drive',
+            drawstyle='steps-post', rasterized=True)
+    ax.plot(results['t'], results['Phi_B'], 'white', lw=1.5, label='Receiver Φ_B', rasterized=True)
     ax.axhline(0, color='gray', ls='--', alpha=0.3)
     ax.set_title(f"{title}\nBER={results['ber']:.1%}, τ={results['detection_time']:.2f}s")
     ax.set_xlabel('Time (s)')
@@ -4,7 +4,7 @@ Real-world detection with noise-adaptive thresholds.
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
+from scipy.signal import lfilter
 import matplotlib.pyplot as plt
 
 def adaptive_threshold(signal, window_size=200, n_sigma=4.5):
@@ -18,6 +18,23 @@ def adaptive_threshold(signal, window_size=200, n_sigma=4.5):
         threshold[i] = np.mean(window) + n_sigma * np.std(window)
     return threshold
 
+def receiver_response(t, bit_drive, bit_duration, rate, coupling):
+    """
+    Exact Φ_B(t) for dΦ_B/dt = -rate·Φ_B + coupling·drive(t) with Φ_B(0) = 0,
+    where drive(t) = bit_drive[k % len(bit_drive)] during bit period k.
+    
+    Within bit k Φ_B relaxes exponentially from its bit-start value Φ_k
+    towards coupling·drive_k/rate; the Φ_k follow a first-order recurrence
+    (evaluated as an IIR filter), so every sample is in closed form.
+    """
+    k = np.floor(np.asarray(t) / bit_duration).astype(np.int64)
+    n_periods = k.max() + 1
+    Phi_eq = coupling * np.asarray(bit_drive, dtype=float)[np.arange(n_periods) % len(bit_drive)] / rate
+    decay = np.exp(-rate * bit_duration)
+    Phi_start = np.zeros(n_periods)
+    Phi_start[1:] = lfilter([1 - decay], [1, -decay], Phi_eq[:-1])
+    return Phi_eq[k] + (Phi_start[k] - Phi_eq[k]) * np.exp(-rate * (t - k * bit_duration))
+
 def run_simulation_with_adaptive(Chern_sender=3.0, Chern_receiver=3.0,
                                  drive_amplitude=1.0, noise_level=0.1,
                                  bit_duration=2.0):
@@ -33,22 +50,14 @@ def run_simulation_with_adaptive(Chern_sender=3.0, Chern_receiver=3.0,
     alpha = 1/137
     total_coupling = (alpha / (2 * np.pi)) * 0.25 * match_factor  # g=0.5 each
     
-    def system_dynamics(t, y):
-        EB_applied, Phi_B = y
-        bit_index = int(t / bit_duration) % len(message_bits)
-        drive = drive_amplitude if message_bits[bit_index] else -drive_amplitude
-        
-        dEB = 0
-        field_drive = total_coupling * drive
-        dPhi = -0.2 * Phi_B + field_drive - theta_receiver**2 * Phi_B
-        return [dEB, dPhi]
-    
     t_eval = np.linspace(0, t_end, int(t_end * 500))  # 500 Hz sampling
-    sol = solve_ivp(system_dynamics, [0, t_end], [0.0, 0.0], 
-                    t_eval=t_eval, method='RK45')
     
-    t = sol.t
-    Phi_B = sol.y[1]
+    # Sender drive: ±drive_amplitude per bit. The receiver
+    # dΦ/dt = -0.2·Φ + g·drive - θ_B²·Φ is linear with a piecewise-constant
+    # drive, so it is evaluated exactly instead of integrated
+    bit_drive = np.where(np.asarray(message_bits, dtype=bool), drive_amplitude, -drive_amplitude)
+    t = t_eval
+    Phi_B = receiver_response(t, bit_drive, bit_duration, 0.2 + theta_receiver**2, total_coupling)
     
     # ====================== ADD REALISTIC NOISE ======================
     # 1. White measurement noise
@@ -97,7 +106,7 @@ def run_simulation_with_adaptive(Chern_sender=3.0, Chern_receiver=3.0,
                 'max_snr': np.max(np.abs(segment_signal) / segment_threshold)
             })
     
-    ber = np.mean([a != b for a, b in zip(message_bits, decoded_bits)])
+    ber = np.mean(np.asarray(message_bits[:len(decoded_bits)]) != np.asarray(decoded_bits))
     
     # ====================== VISUALIZATION ======================
     fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(14, 10), sharex=True)
@@ -12,7 +12,7 @@ Key Features:
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
+from scipy.signal import lfilter
 import matplotlib.pyplot as plt
 
 # ============================= PARAMETERS =============================
@@ -43,29 +43,30 @@ t_end = len(message_bits) * bit_duration + 5
 dt = 0.001
 t_eval = np.linspace(0, t_end, int(t_end/dt) + 1)
 
-# Sender E·B modulation (our control input)
-def sender_EB(t):
-    bit_index = int(t / bit_duration) % len(message_bits)
-    return 1.0 if message_bits[bit_index] else -1.0
+# Sender E·B modulation (our control input): ±1 per bit, repeating
+bit_EB = np.where(np.asarray(message_bits, dtype=bool), 1.0, -1.0)
 
 # ============================= DYNAMICS =============================
-def dynamics(t, y):
-    """Receiver coherence observable driven by sender's E·B via axion coupling"""
-    Phi_B = y[0]
+def receiver_response(t, bit_drive, bit_duration, rate, coupling):
+    """
+    Exact Φ_B(t) for dΦ_B/dt = -rate·Φ_B + coupling·drive(t) with Φ_B(0) = 0,
+    where drive(t) = bit_drive[k % len(bit_drive)] during bit period k.
     
-    # Sender's applied E·B (our input signal)
-    EB_applied = sender_EB(t)
-    
-    # Axion drive term
-    drive = axion_coupling * EB_applied
-    
-    # Driven damped oscillator for receiver
-    dPhiB_dt = -gamma_B * Phi_B + drive - omega_B**2 * Phi_B
-    
-    return [dPhiB_dt]
-
-# Initial state
-y0 = [0.0]
+    Within bit k Φ_B relaxes exponentially from its bit-start value Φ_k
+    towards coupling·drive_k/rate; the Φ_k follow a first-order recurrence
+    (evaluated as an IIR filter), so every sample is in closed form.
+    """
+    k = np.floor(np.asarray(t) / bit_duration).astype(np.int64)
+    n_periods = k.max() + 1
+    Phi_eq = coupling * np.asarray(bit_drive, dtype=float)[np.arange(n_periods) % len(bit_drive)] / rate
+    decay = np.exp(-rate * bit_duration)
+    Phi_start = np.zeros(n_periods)
+    Phi_start[1:] = lfilter([1 - decay], [1, -decay], Phi_eq[:-1])
+    return Phi_eq[k] + (Phi_start[k] - Phi_eq[k]) * np.exp(-rate * (t - k * bit_duration))
+
+# Receiver coherence observable driven by sender's E·B via axion coupling:
+#   dΦ_B/dt = -γ_B Φ_B + g·E·B(t) - ω_B² Φ_B   (driven damped oscillator)
+# Linear with a piecewise-constant drive, so it is evaluated exactly
 
 print("Running Coherence Telephone v2.0 – Physics-First Model")
 print(f"Sender Chern: {Chern_sender} | Receiver Chern: {Chern_receiver}")
@@ -73,11 +74,9 @@ print(f"Address match factor: {match_factor:.4f}")
 print(f"Effective axion coupling: {axion_coupling:.6f}")
 
 # Solve
-sol = solve_ivp(dynamics, (0, t_end), y0, t_eval=t_eval, method='RK45')
-
-t = sol.t
-Phi_B = sol.y[0]
-EB_applied = np.array([sender_EB(ti) for ti in t])
+t = t_eval
+Phi_B = receiver_response(t, bit_EB, bit_duration, gamma_B + omega_B**2, axion_coupling)
+EB_applied = bit_EB[(t / bit_duration).astype(np.int64) % len(message_bits)]
 
 # ============================= DECODING =============================
 decoded_bits = []
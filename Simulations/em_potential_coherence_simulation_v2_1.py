@@ -23,14 +23,281 @@ Notes:
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import simpson
+from scipy.signal import correlate, correlation_lags
 from pathlib import Path
 from dataclasses import dataclass
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; fall back to the NumPy path
+    HAVE_NUMBA = False
+
 C_LIGHT = 299_792_458.0  # m/s
 
+# Storage type of fields and coherence maps; window sums, cumulative phases
+# and other accumulations are carried out in float64
+DTYPE = np.float32
+
+# Largest cross-correlation maxlag evaluated lag-by-lag; wider windows are
+# sliced out of the FFT correlation instead
+MAXLAG_DIRECT = 64
+
+
+def _ddx(A: np.ndarray, dx: float, out: np.ndarray | None = None) -> np.ndarray:
+    """∂A/∂x along axis 1 (same stencil as np.gradient: central inside, one-sided at the edges)."""
+    if out is None:
+        out = np.empty_like(A, dtype=np.result_type(A, DTYPE))
+    np.subtract(A[:, 2:], A[:, :-2], out=out[:, 1:-1])
+    out[:, 1:-1] *= 0.5 / dx
+    out[:, 0] = (A[:, 1] - A[:, 0]) / dx
+    out[:, -1] = (A[:, -1] - A[:, -2]) / dx
+    return out
+
+
+def _ddt(A: np.ndarray, dt: float, out: np.ndarray | None = None) -> np.ndarray:
+    """∂A/∂t along axis 0 (same stencil as np.gradient)."""
+    if out is None:
+        out = np.empty_like(A, dtype=np.result_type(A, DTYPE))
+    np.subtract(A[2:], A[:-2], out=out[1:-1])
+    out[1:-1] *= 0.5 / dt
+    out[0] = (A[1] - A[0]) / dt
+    out[-1] = (A[-1] - A[-2]) / dt
+    return out
+
+
+def _sliding_simpson(y: np.ndarray, dx: float, n_mem: int) -> np.ndarray:
+    """
+    Simpson integral over the memory window along axis 0, for every t at once.
+
+    Equivalent to ``simpson(y[max(0, t - n_mem):t + 1], dx=dx, axis=0)`` for
+    each t (including scipy's handling of 1-, 2- and even-length windows),
+    but evaluated from prefix sums of the even- and odd-indexed samples
+    instead of one Simpson call per time step.
+    """
+    n_t = y.shape[0]
+    t = np.arange(n_t)
+    t0 = np.maximum(0, t - n_mem)
+    length = t - t0 + 1
+    even = (length % 2 == 0) & (length >= 4)
+    hi = np.where(even, t - 1, t)  # end of the composite-Simpson part
+
+    # P[p, i] = sum of y[k] for k < i with k % 2 == p
+    y_even = np.zeros_like(y)
+    y_even[0::2] = y[0::2]
+    P = np.zeros((2, n_t + 1) + y.shape[1:], dtype=np.result_type(y, np.float64))
+    np.cumsum(y_even, axis=0, out=P[0, 1:])
+    np.cumsum(y - y_even, axis=0, out=P[1, 1:])
+
+    # Interior samples at odd offsets from t0 get weight 4, even offsets weight 2
+    p_odd, p_even = (t0 + 1) % 2, t0 % 2
+    interior_odd = P[p_odd, hi] - P[p_odd, t0 + 1]
+    interior_even = P[p_even, hi] - P[p_even, t0 + 1]
+    integral = (dx / 3) * (y[t0] + y[hi] + 4 * interior_odd + 2 * interior_even)
+
+    # Per-window corrections (rows whose mask is False may read y[t - 2] with
+    # wrap-around; those values are discarded)
+    shape = (n_t,) + (1,) * (y.ndim - 1)
+    last = dx * (5 * y[t] + 8 * y[t - 1] - y[t - 2]) / 12
+    integral = np.where(even.reshape(shape), integral + last, integral)
+    integral = np.where((length == 2).reshape(shape), dx * (y[t0] + y[t]) / 2, integral)
+    return np.where((length == 1).reshape(shape), 0, integral)
+
+
+def _sliding_trapezoid(y: np.ndarray, dx: float, n_mem: int) -> np.ndarray:
+    """
+    Trapezoid-rule counterpart of _sliding_simpson over the same windows
+    (a 1-sample window integrates to 0), from a single prefix sum.
+    """
+    n_t = y.shape[0]
+    t = np.arange(n_t)
+    t0 = np.maximum(0, t - n_mem)
+    P = np.zeros((n_t + 1,) + y.shape[1:], dtype=np.result_type(y, np.float64))
+    np.cumsum(y, axis=0, out=P[1:])
+    return dx * (P[t + 1] - P[t0] - 0.5 * (y[t0] + y[t]))
+
+
+def _window_integral(y: np.ndarray, dx: float, n_mem: int, method: str) -> np.ndarray:
+    """Memory-window integral along axis 0 with the given quadrature ("simpson" or "trapz")."""
+    if method == "trapz":
+        return _sliding_trapezoid(y, dx, n_mem)
+    return _sliding_simpson(y, dx, n_mem)
+
+
+if HAVE_NUMBA:
+    @njit(fastmath=True, cache=True)
+    def _column_window_simpson(f, dx, n_mem, out):
+        """Same window rule as _sliding_simpson for one 1-D series f, into out."""
+        n_t = f.shape[0]
+        # P[p, i] = sum of f[k] for k < i with k % 2 == p
+        P = np.zeros((2, n_t + 1), dtype=f.dtype)
+        for k in range(n_t):
+            P[0, k + 1] = P[0, k]
+            P[1, k + 1] = P[1, k]
+            P[k % 2, k + 1] += f[k]
+
+        for t in range(n_t):
+            t0 = max(0, t - n_mem)
+            length = t - t0 + 1
+            if length == 1:
+                out[t] = 0.0
+                continue
+            if length == 2:
+                out[t] = 0.5 * dx * (f[t0] + f[t])
+                continue
+            hi = t - 1 if length % 2 == 0 else t
+            p_odd = (t0 + 1) % 2
+            p_even = t0 % 2
+            s = dx / 3.0 * (f[t0] + f[hi]
+                            + 4.0 * (P[p_odd, hi] - P[p_odd, t0 + 1])
+                            + 2.0 * (P[p_even, hi] - P[p_even, t0 + 1]))
+            if hi != t:
+                s += dx * (5.0 * f[t] + 8.0 * f[t - 1] - f[t - 2]) / 12.0
+            out[t] = s
+
+    @njit(fastmath=True, cache=True)
+    def _column_window_trapezoid(f, dx, n_mem, out):
+        """Same window rule as _sliding_trapezoid for one 1-D series f, into out."""
+        n_t = f.shape[0]
+        P = np.zeros(n_t + 1, dtype=f.dtype)
+        for k in range(n_t):
+            P[k + 1] = P[k] + f[k]
+        for t in range(n_t):
+            t0 = max(0, t - n_mem)
+            out[t] = dx * (P[t + 1] - P[t0] - 0.5 * (f[t0] + f[t]))
+
+    @njit(fastmath=True, cache=True)
+    def _column_window(f, dx, n_mem, trapz, out):
+        """Memory-window integral of f with the trapezoid (trapz=True) or Simpson rule."""
+        if trapz:
+            _column_window_trapezoid(f, dx, n_mem, out)
+        else:
+            _column_window_simpson(f, dx, n_mem, out)
+
+    @njit(fastmath=True, cache=True)
+    def _dx_squared_column(A, ix, dx, out):
+        """(∂A/∂x)² at column ix, with np.gradient's stencil (one-sided at the edges)."""
+        n_t, n_x = A.shape
+        lo = max(ix - 1, 0)
+        hi = min(ix + 1, n_x - 1)
+        h = (hi - lo) * dx
+        for t in range(n_t):
+            g = (A[t, hi] - A[t, lo]) / h
+            out[t] = g * g
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _gradient_kernel(A, dx, dt, n_mem, trapz, alpha, C):
+        """C = clip(exp(-alpha ∫ (∂A/∂x)² dt), 0, 1), fused per column (prange over x)."""
+        n_t, n_x = A.shape
+        for ix in prange(n_x):
+            f = np.empty(n_t)
+            w = np.empty(n_t)
+            _dx_squared_column(A, ix, dx, f)
+            _column_window(f, dt, n_mem, trapz, w)
+            for t in range(n_t):
+                C[t, ix] = min(1.0, np.exp(-alpha * w[t]))
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _energy_kernel(A, dx, dt, n_mem, trapz, beta, C):
+        """C = clip(exp(-beta ∫ ((∂A/∂t)² + (∂A/∂x)²) dt), 0, 1), fused per column."""
+        n_t, n_x = A.shape
+        for ix in prange(n_x):
+            f = np.empty(n_t)
+            w = np.empty(n_t)
+            _dx_squared_column(A, ix, dx, f)
+            for t in range(n_t):
+                lo = max(t - 1, 0)
+                hi = min(t + 1, n_t - 1)
+                g = (A[hi, ix] - A[lo, ix]) / ((hi - lo) * dt)
+                f[t] += g * g
+            _column_window(f, dt, n_mem, trapz, w)
+            for t in range(n_t):
+                C[t, ix] = min(1.0, np.exp(-beta * w[t]))
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _hybrid_kernel(A, dx, dt, n_mem, trapz, alpha, beta, C):
+        """
+        sqrt(C_grad · C_energy) = exp(-(alpha·Ig + beta·Ie) / 2) per column,
+        with (∂A/∂x)² shared by both integrands. Each exponent is clamped at 0,
+        which is the same as clipping each factor to [0, 1].
+        """
+        n_t, n_x = A.shape
+        for ix in prange(n_x):
+            f = np.empty(n_t)
+            wg = np.empty(n_t)
+            we = np.empty(n_t)
+            _dx_squared_column(A, ix, dx, f)
+            _column_window(f, dt, n_mem, trapz, wg)
+            for t in range(n_t):
+                lo = max(t - 1, 0)
+                hi = min(t + 1, n_t - 1)
+                g = (A[hi, ix] - A[lo, ix]) / ((hi - lo) * dt)
+                f[t] += g * g
+            _column_window(f, dt, n_mem, trapz, we)
+            for t in range(n_t):
+                C[t, ix] = np.exp(-0.5 * (max(alpha * wg[t], 0.0) + max(beta * we[t], 0.0)))
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _phase_kernel(A, dt, n_mem, trapz, C):
+        """C = |∫ exp(iφ) dt| / window with φ = ∫ A dt, normalised by its column max."""
+        n_t, n_x = A.shape
+        for ix in prange(n_x):
+            f = np.empty(n_t, dtype=np.complex128)
+            w = np.empty(n_t, dtype=np.complex128)
+            phase = 0.0
+            for t in range(n_t):
+                phase += A[t, ix]
+                f[t] = np.exp(1j * (phase * dt))
+            _column_window(f, dt, n_mem, trapz, w)
+            c = np.empty(n_t)
+            cmax = 1e-12
+            for t in range(n_t):
+                window = max(dt, (t - max(0, t - n_mem) + 1) * dt)
+                c[t] = abs(w[t]) / window
+                cmax = max(cmax, c[t])
+            for t in range(n_t):
+                C[t, ix] = min(1.0, c[t] / cmax)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _variance_kernel(A, n_mem, out):
+        """Variance of A[max(0, t - n_mem):t + 1] per column, from centred running sums."""
+        n_t, n_x = A.shape
+        for ix in prange(n_x):
+            ref = float(A[:, ix].mean())
+            s1 = 0.0
+            s2 = 0.0
+            for t in range(n_t):
+                a = float(A[t, ix]) - ref
+                s1 += a
+                s2 += a * a
+                if t > n_mem:
+                    b = float(A[t - n_mem - 1, ix]) - ref
+                    s1 -= b
+                    s2 -= b * b
+                n = min(t, n_mem) + 1
+                mean = s1 / n
+                out[t, ix] = max(0.0, s2 / n - mean * mean)
+
+
+def _kernel_field(A_field: np.ndarray) -> np.ndarray:
+    """
+    A_field as a C-contiguous float array, so the numba kernels see one
+    (dtype, layout) per storage type and reuse a single cached specialisation
+    instead of compiling extra ones for strided views or integer input.
+    """
+    return np.ascontiguousarray(A_field, dtype=np.result_type(A_field, DTYPE))
+
+
+def _probe_strip(A_field: np.ndarray, idx: int) -> tuple[np.ndarray, int]:
+    """Columns idx-1..idx+1 of A_field (clipped at the edges) and idx's position in them."""
+    lo = max(0, idx - 1)
+    return A_field[:, lo:idx + 2], idx - lo
+
 
 @dataclass
 class EMPotentialCoherence:
@@ -43,6 +310,17 @@ class EMPotentialCoherence:
     alpha: float = 2.0
     beta: float = 1.0
     tau: float = 0.05  # memory window (s)
+    # Window quadrature: "simpson" (O(dt^4), default) or "trapz" (O(dt^2),
+    # one prefix sum instead of two and no parity bookkeeping; noticeably
+    # less accurate on rough, e.g. turbulent, integrands)
+    method: str = "simpson"
+
+    def __post_init__(self):
+        # Plain floats keep the numba kernel signatures fixed (an int alpha
+        # would otherwise trigger a separate compilation)
+        self.alpha, self.beta, self.tau = float(self.alpha), float(self.beta), float(self.tau)
+        if self.method not in ("simpson", "trapz"):
+            raise ValueError(f"Unknown integration method: {self.method!r} (use 'simpson' or 'trapz')")
 
     def _memory_samples(self, dt: float) -> int:
         return max(1, int(self.tau / dt))
@@ -54,16 +332,19 @@ class EMPotentialCoherence:
         Note: This is NOT gauge-invariant. For proper formulation,
         use field strength tensor F_μν.
         """
-        dA_dx = np.gradient(A_field, dx, axis=1)
-        integrand = dA_dx ** 2
-        n_mem = self._memory_samples(dt)
-
-        C = np.zeros_like(A_field, dtype=float)
-        for t in range(A_field.shape[0]):
-            t0 = max(0, t - n_mem)
-            integral = simpson(integrand[t0:t + 1], dx=dt, axis=0)
-            C[t] = np.exp(-self.alpha * integral)
-        return np.clip(C, 0.0, 1.0)
+        if HAVE_NUMBA:
+            A = _kernel_field(A_field)
+            C = np.empty_like(A)
+            _gradient_kernel(A, float(dx), float(dt), self._memory_samples(dt), self.method == "trapz",
+                             self.alpha, C)
+            return C
+
+        integrand = _ddx(A_field, dx)
+        integrand **= 2
+        integral = _window_integral(integrand, dt, self._memory_samples(dt), self.method)
+        integral *= -self.alpha
+        C = np.exp(integral, dtype=integrand.dtype)
+        return np.clip(C, 0.0, 1.0, out=C)
 
     def energy_like(self, A_field: np.ndarray, dx: float, dt: float) -> np.ndarray:
         """
@@ -76,17 +357,22 @@ class EMPotentialCoherence:
         field dynamics while staying always-positive. For gauge-invariant 
         formulation, see field_strength_based method using F_μν.
         """
-        dA_dt = np.gradient(A_field, dt, axis=0)
-        dA_dx = np.gradient(A_field, dx, axis=1)
-        integrand = (dA_dt ** 2) + (dA_dx ** 2)
-        n_mem = self._memory_samples(dt)
-
-        C = np.zeros_like(A_field, dtype=float)
-        for t in range(A_field.shape[0]):
-            t0 = max(0, t - n_mem)
-            integral = simpson(integrand[t0:t + 1], dx=dt, axis=0)
-            C[t] = np.exp(-self.beta * integral)
-        return np.clip(C, 0.0, 1.0)
+        if HAVE_NUMBA:
+            A = _kernel_field(A_field)
+            C = np.empty_like(A)
+            _energy_kernel(A, float(dx), float(dt), self._memory_samples(dt), self.method == "trapz",
+                           self.beta, C)
+            return C
+
+        integrand = _ddt(A_field, dt)
+        integrand **= 2
+        dA_dx_sq = _ddx(A_field, dx)
+        dA_dx_sq **= 2
+        integrand += dA_dx_sq
+        integral = _window_integral(integrand, dt, self._memory_samples(dt), self.method)
+        integral *= -self.beta
+        C = np.exp(integral, dtype=integrand.dtype)
+        return np.clip(C, 0.0, 1.0, out=C)
 
     def phase_wilson_line(self, A_field: np.ndarray, dt: float) -> np.ndarray:
         """
@@ -94,27 +380,75 @@ class EMPotentialCoherence:
           φ ~ ∫ A dt  =>  C ~ |∫ exp(i φ) dt| / window
         """
         n_mem = self._memory_samples(dt)
+        if HAVE_NUMBA:
+            A = _kernel_field(A_field)
+            C = np.empty_like(A)
+            _phase_kernel(A, float(dt), n_mem, self.method == "trapz", C)
+            return C
+
         # Accumulated phase (toy; scalar potential omitted)
-        phase = np.cumsum(A_field, axis=0) * dt
+        phase = np.cumsum(A_field, axis=0, dtype=np.float64) * dt
         phase_factor = np.exp(1j * phase)
 
-        C = np.zeros_like(A_field, dtype=float)
-        for t in range(A_field.shape[0]):
-            t0 = max(0, t - n_mem)
-            integral = simpson(phase_factor[t0:t + 1], dx=dt, axis=0)
-            window = max(dt, (t - t0 + 1) * dt)
-            C[t] = np.abs(integral) / window
+        # Windowed integral of the complex phase factor for all t
+        # at once; window length in samples is t - t0 + 1 >= 1
+        t = np.arange(A_field.shape[0])
+        window = (t - np.maximum(0, t - n_mem) + 1) * dt
+        C = np.abs(_window_integral(phase_factor, dt, n_mem, self.method))
+        C /= window[:, None]
 
-        Cmax = np.maximum(1e-12, np.max(C, axis=0, keepdims=True))
-        return np.clip(C / Cmax, 0.0, 1.0)
+        # Normalise each column by its max in place (C >= 0, so only the
+        # upper clip bound can bite)
+        C /= np.maximum(1e-12, np.max(C, axis=0, keepdims=True))
+        return np.minimum(C, 1.0, out=C).astype(np.result_type(A_field, DTYPE))
 
     def hybrid(self, A_field: np.ndarray, dx: float, dt: float) -> np.ndarray:
         """
         Hybrid = geometric mean of (gradient) and (energy-like)
         """
-        Cg = self.gradient_based(A_field, dx, dt)
-        Ce = self.energy_like(A_field, dx, dt)
-        return np.sqrt(np.clip(Cg * Ce, 0.0, 1.0))
+        n_mem = self._memory_samples(dt)
+        if HAVE_NUMBA:
+            A = _kernel_field(A_field)
+            C = np.empty_like(A)
+            _hybrid_kernel(A, float(dx), float(dt), n_mem, self.method == "trapz", self.alpha, self.beta, C)
+            return C
+
+        # One pass over the derivatives: ∂x A is shared by both integrands, and
+        # sqrt(Cg * Ce) = exp(-(alpha*Ig + beta*Ie) / 2), where clipping each
+        # factor to [0, 1] is the same as clamping its exponent at 0
+        dA_dx_sq = _ddx(A_field, dx)
+        dA_dx_sq **= 2
+        energy_integrand = _ddt(A_field, dt)
+        energy_integrand **= 2
+        energy_integrand += dA_dx_sq
+        Ig = self.alpha * _window_integral(dA_dx_sq, dt, n_mem, self.method)
+        Ie = self.beta * _window_integral(energy_integrand, dt, n_mem, self.method)
+        exponent = np.maximum(Ig, 0.0)
+        exponent += np.maximum(Ie, 0.0)
+        exponent *= -0.5
+        return np.exp(exponent, dtype=dA_dx_sq.dtype)
+
+    # Single-column variants: the memory-window integrals are independent per
+    # x, so a probe column only needs itself and its x-neighbours (for ∂A/∂x,
+    # same stencil as the full field, including one-sided edges)
+    def gradient_at(self, A_field: np.ndarray, dx: float, dt: float, idx: int) -> np.ndarray:
+        """gradient_based(A_field, dx, dt)[:, idx], from a 3-column strip."""
+        strip, j = _probe_strip(A_field, idx)
+        return self.gradient_based(strip, dx, dt)[:, j]
+
+    def energy_at(self, A_field: np.ndarray, dx: float, dt: float, idx: int) -> np.ndarray:
+        """energy_like(A_field, dx, dt)[:, idx], from a 3-column strip."""
+        strip, j = _probe_strip(A_field, idx)
+        return self.energy_like(strip, dx, dt)[:, j]
+
+    def phase_at(self, A_field: np.ndarray, dt: float, idx: int) -> np.ndarray:
+        """phase_wilson_line(A_field, dt)[:, idx] (no x-derivative, so just that column)."""
+        return self.phase_wilson_line(A_field[:, idx:idx + 1], dt)[:, 0]
+
+    def hybrid_at(self, A_field: np.ndarray, dx: float, dt: float, idx: int) -> np.ndarray:
+        """hybrid(A_field, dx, dt)[:, idx], from a 3-column strip."""
+        strip, j = _probe_strip(A_field, idx)
+        return self.hybrid(strip, dx, dt)[:, j]
 
 
 def entropy_coherence(A_field: np.ndarray, dx: float, dt: float, tau: float = 0.05, gamma: float = 1.0) -> np.ndarray:
@@ -123,21 +457,38 @@ def entropy_coherence(A_field: np.ndarray, dx: float, dt: float, tau: float = 0.
     (Kept mainly for comparison; not a "physical" entropy field.)
     """
     n_mem = max(1, int(tau / dt))
-    C = np.zeros_like(A_field, dtype=float)
-
-    for t in range(A_field.shape[0]):
-        t0 = max(0, t - n_mem)
-        window = A_field[t0:t + 1]
-        var = np.var(window, axis=0)
-        C[t] = np.exp(-gamma * var)
+    if HAVE_NUMBA:
+        var = np.empty(A_field.shape)
+        _variance_kernel(_kernel_field(A_field), n_mem, var)
+        C = np.exp(-gamma * var)
+    else:
+        C = np.zeros_like(A_field, dtype=float)
+        for t in range(A_field.shape[0]):
+            t0 = max(0, t - n_mem)
+            window = A_field[t0:t + 1]
+            var = np.var(window, axis=0, dtype=np.float64)
+            C[t] = np.exp(-gamma * var)
 
     Cmax = np.maximum(1e-12, np.max(C, axis=0, keepdims=True))
-    return np.clip(C / Cmax, 0.0, 1.0)
+    return np.clip(C / Cmax, 0.0, 1.0).astype(np.result_type(A_field, DTYPE))
 
 
-def _bits_to_levels(bits: list[int]) -> np.ndarray:
+def _bits_to_levels(bits: list[int] | np.ndarray) -> np.ndarray:
     """Map {0,1} -> {-1,+1} for amplitude modulation."""
-    return np.array([1 if b else -1 for b in bits], dtype=float)
+    return np.where(np.asarray(bits, dtype=bool), 1.0, -1.0)
+
+
+def _bit_envelope(levels: np.ndarray, bit_dur: int, n: int) -> np.ndarray:
+    """Hold each level for bit_dur samples; zero after the last bit, truncated to n samples."""
+    envelope = np.zeros(n, dtype=DTYPE)
+    held = np.repeat(levels, bit_dur)[:n]
+    envelope[:len(held)] = held
+    return envelope
+
+
+def _carrier_phase(x: np.ndarray, t: np.ndarray, k: float, omega: float) -> np.ndarray:
+    """Carrier phase k·x - ω·t on the (t, x) grid, by broadcasting (no meshgrid copies)."""
+    return (k * x[None, :] - omega * t[:, None]).astype(DTYPE)
 
 
 def generate_em_field(mode: str, x: np.ndarray, t: np.ndarray, params: dict) -> tuple[np.ndarray, dict]:
@@ -152,33 +503,33 @@ def generate_em_field(mode: str, x: np.ndarray, t: np.ndarray, params: dict) ->
     - freq_modulated: Frequency-shift keying (FSK)
     - two_node: TX/RX communication setup
     """
-    X, T = np.meshgrid(x, t)
     A0 = float(params.get("A0", 1.0))
     k = float(params.get("k", 2 * np.pi * 3))
     omega = float(params.get("omega", 2 * np.pi * 5))
+    phase = _carrier_phase(x, t, k, omega)
 
     rng = np.random.default_rng(int(params.get("seed", 1234)))
 
     if mode == "smooth":
-        A = A0 * np.sin(k * X - omega * T)
+        A = A0 * np.sin(phase)
         return A, {}
 
     if mode == "turbulent":
-        A = A0 * np.sin(k * X - omega * T)
+        A = A0 * np.sin(phase)
         noise = 0.4 * rng.normal(size=A.shape)
-        kernel = np.ones(5) / 5
-        noise = np.apply_along_axis(lambda v: np.convolve(v, kernel, mode="same"), 1, noise)
-        return A + noise, {}
+        # 5-tap box filter along x (same as np.convolve(row, ones(5)/5, mode="same"),
+        # i.e. zero-padded), as a difference of cumulative sums over all rows at once
+        cs = np.cumsum(np.pad(noise, ((0, 0), (3, 2))), axis=1)
+        A += (cs[:, 5:] - cs[:, :-5]) / 5
+        return A, {}
 
     if mode == "modulated":
         # Amplitude Modulation (AM)
         bits = params.get("bit_pattern", [1, 0, 1, 1, 0])
         levels = _bits_to_levels(bits)
         bit_dur = max(1, len(t) // len(bits))
-        envelope = np.zeros_like(t, dtype=float)
-        for i, lvl in enumerate(levels):
-            envelope[i * bit_dur: min((i + 1) * bit_dur, len(t))] = lvl
-        A = A0 * (1.0 + 0.25 * envelope[:, None]) * np.sin(k * X - omega * T)
+        envelope = _bit_envelope(levels, bit_dur, len(t))
+        A = A0 * (1.0 + 0.25 * envelope[:, None]) * np.sin(phase)
         return A, {"bit_pattern": bits, "bit_duration": bit_dur, "envelope": envelope}
 
     if mode == "phase_modulated":
@@ -187,13 +538,9 @@ def generate_em_field(mode: str, x: np.ndarray, t: np.ndarray, params: dict) ->
         bit_dur = max(1, len(t) // len(bits))
         
         # Phase shift: 0 → 0°, 1 → 180°
-        phase_shift = np.zeros_like(t, dtype=float)
-        for i, bit in enumerate(bits):
-            start = i * bit_dur
-            end = min((i + 1) * bit_dur, len(t))
-            phase_shift[start:end] = np.pi if bit == 1 else 0.0
+        phase_shift = _bit_envelope(np.where(np.asarray(bits) == 1, np.pi, 0.0), bit_dur, len(t))
         
-        A = A0 * np.sin(k * X - omega * T + phase_shift[:, None])
+        A = A0 * np.sin(phase + phase_shift[:, None])
         return A, {"bit_pattern": bits, "bit_duration": bit_dur, "phase_shift": phase_shift}
 
     if mode == "freq_modulated":
@@ -205,43 +552,40 @@ def generate_em_field(mode: str, x: np.ndarray, t: np.ndarray, params: dict) ->
         f0 = float(params.get("f0", omega / (2*np.pi) * 0.8))  # Lower freq for bit=0
         f1 = float(params.get("f1", omega / (2*np.pi) * 1.2))  # Higher freq for bit=1
         
-        freq_signal = np.zeros_like(t, dtype=float)
-        for i, bit in enumerate(bits):
-            start = i * bit_dur
-            end = min((i + 1) * bit_dur, len(t))
-            freq = f1 if bit == 1 else f0
-            freq_signal[start:end] = freq
+        freq_signal = _bit_envelope(np.where(np.asarray(bits) == 1, f1, f0), bit_dur, len(t))
         
-        # Create FSK signal - frequency modulates in time, constant in space
-        A = np.zeros_like(X, dtype=float)
-        for ti in range(len(t)):
-            freq = freq_signal[ti]
-            phase_ti = 2 * np.pi * freq * t[ti]
-            A[ti, :] = A0 * np.sin(k * x - phase_ti)
+        # Create FSK signal - frequency modulates in time, constant in space.
+        # The phase 2π·f(t)·t is not continuous across bit boundaries.
+        phase_t = 2 * np.pi * freq_signal * t
+        A = A0 * np.sin((k * x[None, :] - phase_t[:, None]).astype(DTYPE))
         
         return A, {"bit_pattern": bits, "bit_duration": bit_dur, "freq_signal": freq_signal, "f0": f0, "f1": f1}
 
     if mode == "two_node":
+        # Unpack the scalar parameters once. They stay Python floats on
+        # purpose: under NumPy's promotion rules a Python float keeps the
+        # float32 field float32, whereas an np.float64 scalar would upcast it.
         x_A = float(params.get("x_A", x[len(x)//4]))
         x_B = float(params.get("x_B", x[3*len(x)//4]))
+        sigma = float(params.get("sigma", 0.02))
+        tx_strength = float(params.get("tx_strength", 0.75))
+        rx_strength = float(params.get("rx_strength", 0.35))
+        couple = bool(params.get("enable_coupling", True))
+        v = float(params.get("coupling_speed", C_LIGHT))
 
         bits = params.get("bit_pattern", [1, 0, 1, 1, 0, 1, 0, 0, 1, 1])
         levels = _bits_to_levels(bits)
         bit_dur = max(1, len(t) // len(bits))
 
-        A = A0 * np.sin(k * X - omega * T)
+        A = A0 * np.sin(phase)
 
-        envelope = np.zeros_like(t, dtype=float)
-        for i, lvl in enumerate(levels):
-            envelope[i * bit_dur: min((i + 1) * bit_dur, len(t))] = lvl
+        envelope = _bit_envelope(levels, bit_dur, len(t))
 
-        sigma = float(params.get("sigma", 0.02))
-        tx_profile = np.exp(-((X - x_A) ** 2) / (2 * sigma ** 2))
-        A += float(params.get("tx_strength", 0.75)) * (envelope[:, None] * tx_profile)
+        # Strengths are folded into the 1-D profiles, not the T x X products
+        tx_profile = (tx_strength * np.exp(-((x - x_A) ** 2) / (2 * sigma ** 2))).astype(DTYPE)
+        A += envelope[:, None] * tx_profile
 
-        couple = bool(params.get("enable_coupling", True))
         if couple:
-            v = float(params.get("coupling_speed", C_LIGHT))
             delay = 0.0 if not np.isfinite(v) else (abs(x_B - x_A) / v)
             delay_steps = int(round(delay / (t[1] - t[0])))
 
@@ -249,8 +593,8 @@ def generate_em_field(mode: str, x: np.ndarray, t: np.ndarray, params: dict) ->
             if delay_steps > 0:
                 env_delayed[:delay_steps] = 0.0
 
-            rx_profile = np.exp(-((X - x_B) ** 2) / (2 * sigma ** 2))
-            A += float(params.get("rx_strength", 0.35)) * (env_delayed[:, None] * rx_profile)
+            rx_profile = (rx_strength * np.exp(-((x - x_B) ** 2) / (2 * sigma ** 2))).astype(DTYPE)
+            A += env_delayed[:, None] * rx_profile
 
         meta = {
             "x_A": x_A, "x_B": x_B,
@@ -258,7 +602,7 @@ def generate_em_field(mode: str, x: np.ndarray, t: np.ndarray, params: dict) ->
             "bit_duration": bit_dur,
             "envelope": envelope,
             "enable_coupling": couple,
-            "coupling_speed": float(params.get("coupling_speed", C_LIGHT)),
+            "coupling_speed": v,
         }
         return A, meta
 
@@ -266,7 +610,8 @@ def generate_em_field(mode: str, x: np.ndarray, t: np.ndarray, params: dict) ->
 
 
 def decode_bits_from_trace(trace: np.ndarray, bit_pattern: list[int], bit_duration: int, 
-                           trim: int = 0, noise_level: float = 0.0) -> dict:
+                           trim: int = 0, noise_level: float = 0.0,
+                           noise: np.ndarray | None = None) -> dict:
     """
     Decode bits from a 1D trace by window-averaging and thresholding.
     
@@ -282,22 +627,29 @@ def decode_bits_from_trace(trace: np.ndarray, bit_pattern: list[int], bit_durati
         Skip this many samples at start of each bit window (settling time)
     noise_level : float
         Add Gaussian noise to trace before decoding (for robustness testing)
+    noise : array, optional
+        Pre-drawn, already scaled noise added to the trace instead of drawing
+        from a fixed seed; lets sweeps use one RNG stream for all calls
     """
     # Add noise if specified
-    if noise_level > 0:
+    if noise is not None:
+        trace = trace + noise
+    elif noise_level > 0:
         rng = np.random.default_rng(42)
         trace = trace + rng.normal(0, noise_level, trace.shape)
     
     nbits = len(bit_pattern)
     y_true = np.array(bit_pattern, dtype=int)
 
-    feats = []
-    for i in range(nbits):
-        s = i * bit_duration + trim
-        e = min((i + 1) * bit_duration, len(trace))
-        feats.append(float(np.mean(trace[s:e])) if s < e else np.nan)
-
-    feats = np.array(feats, dtype=float)
+    # Window means for all bits at once from a prefix sum: bit i averages
+    # trace[i*bit_duration + trim : min((i+1)*bit_duration, len(trace))]
+    bit_idx = np.arange(nbits)
+    starts = np.minimum(bit_idx * bit_duration + trim, len(trace))
+    ends = np.minimum((bit_idx + 1) * bit_duration, len(trace))
+    cs = np.concatenate(([0.0], np.cumsum(trace, dtype=np.float64)))
+    counts = ends - starts
+    with np.errstate(invalid="ignore", divide="ignore"):
+        feats = np.where(counts > 0, (cs[ends] - cs[starts]) / counts, np.nan)
     valid = np.isfinite(feats)
     feats_v = feats[valid]
     y_true_v = y_true[valid]
@@ -330,6 +682,48 @@ def decode_bits_from_trace(trace: np.ndarray, bit_pattern: list[int], bit_durati
     }
 
 
+class FunctionalCache:
+    """
+    Probe traces of every leaderboard functional for one field A, computed
+    lazily and kept, so functionals that share work reuse it: hybrid is
+    sqrt(C_grad · C_energy) from the cached gradient and energy traces.
+    """
+
+    names = ("grad", "energy", "phase", "hybrid", "entropy")
+
+    def __init__(self, em: EMPotentialCoherence, A: np.ndarray, dx: float, dt: float, idx: int,
+                 tau_entropy: float = 0.05, gamma_entropy: float = 1.0):
+        self.em, self.A, self.dx, self.dt, self.idx = em, A, dx, dt, idx
+        self.tau_entropy, self.gamma_entropy = tau_entropy, gamma_entropy
+        self._cache: dict[str, np.ndarray] = {}
+
+    def _get(self, key: str, compute) -> np.ndarray:
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def grad(self) -> np.ndarray:
+        return self._get("grad", lambda: self.em.gradient_at(self.A, self.dx, self.dt, self.idx))
+
+    def energy(self) -> np.ndarray:
+        return self._get("energy", lambda: self.em.energy_at(self.A, self.dx, self.dt, self.idx))
+
+    def phase(self) -> np.ndarray:
+        return self._get("phase", lambda: self.em.phase_at(self.A, self.dt, self.idx))
+
+    def hybrid(self) -> np.ndarray:
+        return self._get("hybrid", lambda: np.sqrt(np.clip(self.grad() * self.energy(), 0.0, 1.0)))
+
+    def entropy(self) -> np.ndarray:
+        col = self.A[:, self.idx:self.idx + 1]
+        return self._get("entropy", lambda: entropy_coherence(col, self.dx, self.dt, tau=self.tau_entropy,
+                                                              gamma=self.gamma_entropy)[:, 0])
+
+    def traces(self) -> dict[str, np.ndarray]:
+        """All functionals' probe traces, in leaderboard order."""
+        return {name: getattr(self, name)() for name in self.names}
+
+
 def ber_leaderboard(
     x: np.ndarray,
     t: np.ndarray,
@@ -366,40 +760,49 @@ def ber_leaderboard(
                                     "f0": 4.0, "f1": 6.0}),
     ]
 
-    # Functionals (feature extractors / "demods") - create with correct dx,dt from params
-    def make_functionals(em_obj, dx_val, dt_val, tau_ent, gamma_ent):
-        return {
-            "grad":   lambda A: em_obj.gradient_based(A, dx_val, dt_val),
-            "energy": lambda A: em_obj.energy_like(A, dx_val, dt_val),
-            "phase":  lambda A: em_obj.phase_wilson_line(A, dt_val),
-            "hybrid": lambda A: em_obj.hybrid(A, dx_val, dt_val),
-            "entropy": lambda A: entropy_coherence(A, dx_val, dt_val, tau=tau_ent, gamma=gamma_ent),
-        }
-    
-    functionals = make_functionals(em, dx, dt, tau_entropy, gamma_entropy)
-
-    results: list[dict] = []
-
+    # Fields are cached per (mode, params), and each field's functionals share
+    # one FunctionalCache, so repeated scenarios and shared sub-results
+    # (hybrid from grad/energy) are computed once
+    field_cache: dict[tuple[str, str], tuple[np.ndarray, dict, FunctionalCache]] = {}
+    fields = []
     for mod_label, mode, params in scenarios:
-        # Try generating this modulation; skip if not implemented.
-        try:
-            A, meta = generate_em_field(mode, x, t, params)
-        except Exception as e:
-            print(f"[SKIP] {mod_label} ({mode}) not available: {e}")
-            continue
+        key = (mode, repr(sorted(params.items())))
+        if key not in field_cache:
+            # Try generating this modulation; skip if not implemented.
+            try:
+                A, meta = generate_em_field(mode, x, t, params)
+            except Exception as e:
+                print(f"[SKIP] {mod_label} ({mode}) not available: {e}")
+                continue
+
+            if "bit_pattern" not in meta or "bit_duration" not in meta:
+                print(f"[SKIP] {mod_label} ({mode}) missing bit metadata in meta dict.")
+                continue
+            field_cache[key] = (A, meta, FunctionalCache(em, A, dx, dt, idx_probe, tau_entropy, gamma_entropy))
+        fields.append((mod_label, mode, key))
+
+    # The fields are independent. The numba kernels already spread each call
+    # over all cores with prange, so they run one at a time on this thread
+    # (launching the parallel kernels from a worker thread first can also
+    # keep the TBB threading layer from shutting down at exit). The NumPy
+    # path evaluates the fields on threads instead: large ufuncs release the
+    # GIL, and nothing needs pickling.
+    if HAVE_NUMBA:
+        traces = {key: cache.traces() for key, (_, _, cache) in field_cache.items()}
+    else:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            futures = {key: ex.submit(cache.traces) for key, (_, _, cache) in field_cache.items()}
+        traces = {key: fut.result() for key, fut in futures.items()}
 
-        if "bit_pattern" not in meta or "bit_duration" not in meta:
-            print(f"[SKIP] {mod_label} ({mode}) missing bit metadata in meta dict.")
-            continue
+    results: list[dict] = []
 
+    for mod_label, mode, key in fields:
+        meta = field_cache[key][1]
         bit_pattern = meta["bit_pattern"]
         bit_duration = int(meta["bit_duration"])
         trim = max(1, bit_duration // 10)
 
-        for fname, f in functionals.items():
-            C = f(A)
-            trace = C[:, idx_probe]
-
+        for fname, trace in traces[key].items():
             dec = decode_bits_from_trace(trace, bit_pattern, bit_duration, trim=trim)
 
             # Separation margin for interpretability
@@ -554,7 +957,10 @@ def run_comparison(outputs: Path) -> plt.Figure:
 
         for c, (M, title) in enumerate(mats):
             ax = axes[r, c]
-            im = ax.imshow(M, aspect="auto", extent=[x[0], x[-1], t[-1], t[0]])
+            # Nearest-neighbour shows the grid samples as-is and is the cheapest
+            # resampling when the panel is rasterized for savefig
+            im = ax.imshow(M, aspect="auto", interpolation="nearest", rasterized=True,
+                           extent=[x[0], x[-1], t[-1], t[0]])
             ax.set_title(f"{mode}: {title}")
             ax.set_xlabel("x")
             ax.set_ylabel("t")
@@ -562,7 +968,9 @@ def run_comparison(outputs: Path) -> plt.Figure:
 
     fig.tight_layout()
     out = outputs / "em_coherence_comparison_v2.png"
-    fig.savefig(out, dpi=300, bbox_inches="tight")
+    # 150 dpi still gives each ~460 x 580 px panel more pixels than the
+    # 200 (x) x 400 (t) grid has samples; the line/bar figures keep 300 dpi
+    fig.savefig(out, dpi=150, bbox_inches="tight")
     print(f"Saved: {out}")
     return fig
 
@@ -610,10 +1018,8 @@ def run_coupling_speed_comparison(outputs: Path) -> plt.Figure:
         params = {**base_params, "coupling_speed": speed}
         A, meta = generate_em_field("two_node", x, t, params)
         
-        C = em.hybrid(A, dx, dt)
-        
         idx_B = int(np.argmin(np.abs(x - x_B)))
-        C_B = C[:, idx_B]
+        C_B = em.hybrid_at(A, dx, dt, idx_B)
         
         bit_dur = int(meta["bit_duration"])
         decode = decode_bits_from_trace(C_B, meta["bit_pattern"], bit_dur, 
@@ -722,9 +1128,9 @@ def run_noise_robustness_test(outputs: Path) -> plt.Figure:
     
     # Test different functionals
     functionals = [
-        ("Gradient", em.gradient_based),
-        ("Energy-like", em.energy_like),
-        ("Hybrid", em.hybrid),
+        ("Gradient", em.gradient_at),
+        ("Energy-like", em.energy_at),
+        ("Hybrid", em.hybrid_at),
     ]
     
     noise_levels = np.linspace(0, 0.3, 10)
@@ -734,14 +1140,19 @@ def run_noise_robustness_test(outputs: Path) -> plt.Figure:
     idx_B = int(np.argmin(np.abs(x - x_B)))
     bit_dur = int(meta["bit_duration"])
     
-    for noise in noise_levels:
-        for name, func in functionals:
-            C = func(A, dx, dt)
-            C_B = C[:, idx_B]
-            
+    # A is fixed across the sweep, so each functional's RX trace is computed once
+    traces = {name: func(A, dx, dt, idx_B) for name, func in functionals}
+
+    # One unit-noise realisation per level, drawn in a single batch from one
+    # stream and shared by all functionals at that level
+    rng = np.random.default_rng(42)
+    unit_noise = rng.standard_normal((len(noise_levels), len(t)))
+
+    for noise, z in zip(noise_levels, unit_noise):
+        for name, C_B in traces.items():
             decode = decode_bits_from_trace(C_B, meta["bit_pattern"], bit_dur,
                                            trim=max(1, bit_dur // 10),
-                                           noise_level=noise)
+                                           noise=noise * z)
             results[name].append(decode["ber"])
 
     # Plot
@@ -767,8 +1178,45 @@ def run_noise_robustness_test(outputs: Path) -> plt.Figure:
     return fig
 
 
-def run_two_node_simulation(outputs: Path) -> plt.Figure:
-    """Enhanced two-node simulation with BER calculation"""
+def _cross_correlation(a: np.ndarray, b: np.ndarray, maxlag: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (lags, corr) with corr[lag] = sum_n a[n + lag] * b[n], as in
+    correlate(a, b, mode="full"), restricted to |lag| <= maxlag if given.
+    The traces may differ in length; the window is clipped to the lags the
+    full correlation has, -(len(b) - 1) .. len(a) - 1.
+    Short windows take one dot product per lag (O(N·maxlag)); wide ones
+    slice the O(N log N) FFT correlation.
+    """
+    if maxlag is not None and maxlag < 0:
+        raise ValueError(f"maxlag must be >= 0, got {maxlag}")
+    na, nb = len(a), len(b)
+    lags = correlation_lags(na, nb, mode="full")
+    if maxlag is None or maxlag >= max(na, nb) - 1:
+        return lags, correlate(a, b, mode="full", method="fft")
+    # Zero lag sits at index nb - 1 of the full correlation
+    lo, hi = max(-maxlag, -(nb - 1)), min(maxlag, na - 1)
+    window = slice(lo + nb - 1, hi + nb)
+    lags = lags[window]
+    if len(lags) != hi - lo + 1 or lags[0] != lo or lags[-1] != hi:
+        raise RuntimeError(f"lag window [{lo}, {hi}] not covered by correlation_lags({na}, {nb})")
+    if maxlag > MAXLAG_DIRECT:
+        return lags, correlate(a, b, mode="full", method="fft")[window]
+    # Overlap for lag k: b[n] with a[n + k] for max(0, -k) <= n < min(nb, na - k)
+    corr = np.array([np.dot(a[max(0, -k) + k:min(nb, na - k) + k], b[max(0, -k):min(nb, na - k)])
+                     for k in lags])
+    return lags, corr
+
+
+def run_two_node_simulation(outputs: Path, maxlag: int | None = None) -> plt.Figure:
+    """
+    Enhanced two-node simulation with BER calculation.
+
+    maxlag limits the A/B cross-correlation to |lag| <= maxlag samples. The
+    default covers the A→B light-travel time plus one bit window of margin
+    (±51 lags, about ±0.2 s, on this grid). The correlation panel, the argmax
+    peak search and the reported peak lag only see that window. Pass
+    maxlag=len(t) - 1 to correlate every lag.
+    """
     print("\n" + "=" * 60)
     print("Two-Node Communication Simulation v2.1")
     print("=" * 60)
@@ -810,8 +1258,9 @@ def run_two_node_simulation(outputs: Path) -> plt.Figure:
     bit_dur = int(meta["bit_duration"])
     decode = decode_bits_from_trace(C_B, meta["bit_pattern"], bit_dur, trim=max(1, bit_dur // 10))
 
-    corr = np.correlate(C_A - np.mean(C_A), C_B - np.mean(C_B), mode="full")
-    lags = np.arange(-len(C_A) + 1, len(C_A))
+    if maxlag is None:
+        maxlag = int(np.ceil((x_B - x_A) / C_LIGHT / dt)) + bit_dur
+    lags, corr = _cross_correlation(C_A - np.mean(C_A), C_B - np.mean(C_B), maxlag)
     lag_time = lags * dt
     peak_idx = int(np.argmax(np.abs(corr)))
     peak_lag = float(lag_time[peak_idx])
@@ -910,11 +1359,12 @@ def main() -> None:
     print("  • Noise robustness testing")
     print("=" * 60)
     
-    # Standard tests
-    run_comparison(outputs)
-    run_two_node_simulation(outputs)
-    run_coupling_speed_comparison(outputs)
-    run_noise_robustness_test(outputs)
+    # Standard tests. Each figure is saved by its runner; close it right away
+    # so the pyplot registry does not keep every canvas alive until exit
+    plt.close(run_comparison(outputs))
+    plt.close(run_two_node_simulation(outputs))
+    plt.close(run_coupling_speed_comparison(outputs))
+    plt.close(run_noise_robustness_test(outputs))
     
     # NEW: BER Leaderboard  
     x_lb = np.linspace(0, 1, 220)
@@ -924,7 +1374,7 @@ def main() -> None:
     em_lb = EMPotentialCoherence(alpha=2.0, beta=1.0, tau=0.05)
     
     results = ber_leaderboard(x_lb, t_lb, em_lb, dx_lb, dt_lb)
-    plot_ber_leaderboard(results, outputs)
+    plt.close(plot_ber_leaderboard(results, outputs))
     
     print("\n" + "=" * 60)
     print("Simulation Complete - v2.1")